@@ -1,15 +1,12 @@
 # hotline_demo_windows.py
-import os, queue, time, threading
+import os, re, queue, time, threading, itertools, hashlib, asyncio, tempfile
+from collections import deque, OrderedDict
 import sounddevice as sd
 import webrtcvad
 import argparse
-from io import BytesIO
-import wave
 from deepgram import Deepgram
 from elevenlabs import ElevenLabs
 from openai import OpenAI
-from pydub import AudioSegment
-from simpleaudio import play_buffer
 import numpy as np
 
 # Load environment variables from .env file
@@ -34,16 +31,19 @@ except ImportError:
 MIN_RMS = 500  # adjust threshold up/down to tune sensitivity
 BARGEIN_MIN_RMS = 2000  # Very high threshold for barge-in to reduce false triggers
 
+def mean_square(chunk):
+    """Mean of the squared int16 samples (RMS squared) in one pass, no squared temporary"""
+    samples = np.frombuffer(chunk, dtype=np.int16).astype(np.float32)
+    if samples.size == 0:
+        return 0.0
+    return float(np.dot(samples, samples)) / samples.size
+
 def is_loud_enough(chunk):
-    samples = np.frombuffer(chunk, dtype=np.int16)
-    rms = np.sqrt(np.mean(samples.astype(np.float32)**2))
-    return rms > MIN_RMS
+    return mean_square(chunk) > MIN_RMS ** 2  # compare squared; skips the sqrt
 
 def is_loud_enough_for_bargein(chunk):
     """More stringent audio check for barge-in detection"""
-    samples = np.frombuffer(chunk, dtype=np.int16)
-    rms = np.sqrt(np.mean(samples.astype(np.float32)**2))
-    return rms > BARGEIN_MIN_RMS
+    return mean_square(chunk) > BARGEIN_MIN_RMS ** 2
 
 def is_likely_echo(chunk):
     """Simple check to see if audio chunk might be echo from speakers"""
@@ -95,11 +95,17 @@ else:
     MAX_UTTERANCE_SEC = 12
     SILENCE_TAIL_MS = 700
 
+# Derived frame geometry, computed once instead of on every captured frame
+FRAME_SAMPLES = SAMPLE_RATE * FRAME_MS // 1000
+FRAME_BYTES = FRAME_SAMPLES * 2 * CHANNELS  # int16
+
 # Barge-in controls
 ENABLE_BARGEIN = True  # will be overridden by --mode at startup
 BARGEIN_DEBOUNCE_FRAMES = 8   # require N consecutive "speech" frames before cutting TTS (increased from 3)
 BARGEIN_VAD_SENSITIVITY = 0   # Least sensitive VAD for barge-in (0-3, lower = less sensitive)
 TTS_PREROLL_MS = 120          # prevents first-phoneme cutoff
+TTS_OUTPUT_FORMAT = "pcm_16000"  # raw 16-bit mono PCM from ElevenLabs (no MP3 decode)
+TTS_SAMPLE_RATE = 16000          # must match TTS_OUTPUT_FORMAT
 BARGEIN_DELAY_MS = 1000       # longer delay before enabling barge-in to avoid echo from TTS
 
 # ---------- CONFIG ----------
@@ -120,21 +126,61 @@ SYSTEM_PROMPTS = {
 
 }
 
+# Fixed lines spoken every call; pre-rendered so they skip the TTS round-trip
+GREETING_TEMPLATE = "Hello. You are speaking with {name}. Ask your question."
+FAREWELL_TEXT = "Goodbye."
+FALLBACK_REPLY = "I'm having trouble thinking right now. Could you try again?"
+
+# Whole-utterance hang-up phrases; tolerates case and the punctuation smart_format adds ("Goodbye.")
+GOODBYE_RE = re.compile(r"\W*(?:good\s*bye|bye|hang\s+up|end\s+call)\W*", re.IGNORECASE)
+TEXT_GOODBYE_RE = re.compile(r"\W*(?:good\s*bye|bye|hang\s+up|end\s+call|quit|exit)\W*", re.IGNORECASE)
+
 # ---------- CLIENTS ----------
 # Initialize clients only when needed
 dg = None
 oai = None
 eleven = None
 
+clients_lock = threading.Lock()
+
 def init_clients():
     """Initialize API clients when needed"""
     global dg, oai, eleven
-    if dg is None:
-        dg = Deepgram(os.getenv("DEEPGRAM_API_KEY"))
-    if oai is None:
-        oai = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-    if eleven is None:
-        eleven = ElevenLabs(api_key=os.getenv("ELEVEN_API_KEY"))
+    with clients_lock:
+        if dg is None:
+            dg = Deepgram(os.getenv("DEEPGRAM_API_KEY"))
+        if oai is None:
+            oai = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        if eleven is None:
+            eleven = ElevenLabs(api_key=os.getenv("ELEVEN_API_KEY"))
+
+def warm_clients():
+    """Create the clients and open the OpenAI and ElevenLabs connections before the first turn needs them"""
+    try:
+        init_clients()
+    except Exception as e:
+        print(f"⚠️  Could not warm API connections: {e}")
+        return
+    # Cheap GETs that leave a TLS connection in each client's keep-alive pool.
+    # ElevenLabs needs its own: cached greetings/farewells no longer reach it.
+    for warm in (lambda: oai.models.list(), lambda: eleven.voices.get_all()):
+        try:
+            warm()
+        except Exception as e:
+            print(f"⚠️  Could not warm API connections: {e}")
+
+# One event loop for the async Deepgram SDK, reused for every turn.
+# The live socket is still opened per turn: this loop only runs inside run_async, so
+# between turns nothing would answer pings or send KeepAlive while the reply plays,
+# and Deepgram closes a stream that goes ~10 s without audio.
+dg_loop = None
+
+def run_async(coro):
+    """Run a coroutine to completion on the shared Deepgram event loop"""
+    global dg_loop
+    if dg_loop is None or dg_loop.is_closed():
+        dg_loop = asyncio.new_event_loop()
+    return dg_loop.run_until_complete(coro)
 
 # Playback state (so we can stop it on barge-in)
 current_playback = None
@@ -215,7 +261,7 @@ def rotary_callback(channel):
     """Handle rotary dial pulses to decode dialed numbers"""
     global rotary_state, rotary_count, last_rotary_time
     
-    current_time = time.time()
+    current_time = time.monotonic()
     if current_time - last_rotary_time < 0.01:  # Debounce
         return
     
@@ -243,11 +289,11 @@ def get_dialed_number():
         return None
     
     # Wait for dialing to complete (timeout after 3 seconds)
-    start_time = time.time()
-    while time.time() - start_time < 3:
+    start_time = time.monotonic()
+    while time.monotonic() - start_time < 3:
         if rotary_count > 0:
             time.sleep(0.1)  # Wait for more pulses
-            if time.time() - start_time > 0.5:  # Gap indicates end of digit
+            if time.monotonic() - start_time > 0.5:  # Gap indicates end of digit
                 break
     
     if rotary_count > 0:
@@ -350,65 +396,165 @@ def list_audio_devices():
         print(f"❌ Could not list audio devices: {e}")
 
 # ---------- AUDIO CAPTURE ----------
-def record_until_silence():
+def record_until_silence(on_frame=None):
+    """Capture one utterance; on_frame (if given) is called with each raw frame as it arrives."""
     vad = webrtcvad.Vad(VAD_SENSITIVITY)
     buf, q = [], queue.Queue()
     def cb(indata, frames, time_info, status): q.put(bytes(indata))
     with sd.RawInputStream(samplerate=SAMPLE_RATE,
-                           blocksize=int(SAMPLE_RATE * FRAME_MS / 1000),
+                           blocksize=FRAME_SAMPLES,
                            channels=CHANNELS, dtype='int16', callback=cb):
-        start = time.time()
-        last_voice_ms = 0
+        # Absolute monotonic deadlines: immune to wall-clock jumps, no per-frame subtraction drift
+        utterance_deadline = time.monotonic() + MAX_UTTERANCE_SEC
+        silence_deadline = None  # armed once voice is heard, pushed out on every voiced frame
         while True:
             chunk = q.get()
             buf.append(chunk)
-            if len(chunk) == int(SAMPLE_RATE * FRAME_MS / 1000) * 2:
+            if on_frame is not None:
+                on_frame(chunk)
+            now = time.monotonic()
+            if len(chunk) == FRAME_BYTES:
                 if vad.is_speech(chunk, SAMPLE_RATE) and is_loud_enough(chunk):
-                    last_voice_ms = (time.time() - start) * 1000
-            elapsed_ms = (time.time() - start) * 1000
-            if elapsed_ms > MAX_UTTERANCE_SEC * 1000: break
-            if last_voice_ms > 0 and (elapsed_ms - last_voice_ms) > SILENCE_TAIL_MS: break
+                    silence_deadline = now + SILENCE_TAIL_MS / 1000
+            if now > utterance_deadline: break
+            if silence_deadline is not None and now > silence_deadline: break
     return b"".join(buf)
 
-# Helper: wrap raw PCM16 as WAV bytes (Deepgram works best with standard containers)
-def pcm16_to_wav_bytes(pcm_bytes, sample_rate=16000, channels=1):
-    bio = BytesIO()
-    with wave.open(bio, 'wb') as wf:
-        wf.setnchannels(channels)
-        wf.setsampwidth(2)  # 16-bit
-        wf.setframerate(sample_rate)
-        wf.writeframes(pcm_bytes)
-    return bio.getvalue()
-
 # ---------- ASR (Deepgram v2 REST) ----------
-import asyncio
+# e.g. DEEPGRAM_MODEL=nova-2-phonecall when the mic is a telephone handset
+DEEPGRAM_MODEL = os.getenv("DEEPGRAM_MODEL", "nova-2")
 
 def asr_deepgram_pcm16(audio_bytes):
     try:
         init_clients()  # Initialize clients if needed
-        wav_bytes = pcm16_to_wav_bytes(audio_bytes, SAMPLE_RATE, CHANNELS)
-        source = {"buffer": wav_bytes, "mimetype": "audio/wav"}
+        # Send the captured PCM as-is; encoding/sample_rate describe the raw stream
+        source = {"buffer": audio_bytes, "mimetype": "audio/l16"}
         
-        # Create a new event loop for this async call
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
-        try:
-            resp = loop.run_until_complete(dg.transcription.prerecorded(source, {
-                "model": "nova-2",
-                "smart_format": True,
-                "punctuate": True,
-                "language": "en-US"
-            }))
-            alt = resp["results"]["channels"][0]["alternatives"][0]
-            return alt["transcript"].strip() if alt["transcript"] else ""
-        finally:
-            loop.close()
+        resp = run_async(dg.transcription.prerecorded(source, {
+            "model": DEEPGRAM_MODEL,
+            "smart_format": True,
+            "punctuate": True,
+            "language": "en-US",
+            "encoding": "linear16",
+            "sample_rate": SAMPLE_RATE,
+            "channels": CHANNELS,
+        }))
+        alt = resp["results"]["channels"][0]["alternatives"][0]
+        return alt["transcript"].strip() if alt["transcript"] else ""
             
     except Exception as e:
         print(f"❌ Speech recognition failed: {e}")
         return ""
 
+# ---------- ASR (Deepgram v2 live streaming) ----------
+DEEPGRAM_LIVE_OPTIONS = {
+    "model": DEEPGRAM_MODEL,
+    "smart_format": True,
+    "no_delay": True,  # don't hold finals back for smart_format number formatting
+    "punctuate": True,
+    "language": "en-US",
+    "encoding": "linear16",
+    "sample_rate": SAMPLE_RATE,
+    "channels": CHANNELS,
+}
+
+LIVE_FINISH_TIMEOUT_SEC = 3  # wait this long for the last live transcript, then use REST
+
+async def _close_live(live):
+    """Close a live socket that did not finish cleanly, ending the SDK's tasks on dg_loop."""
+    live.done = True  # _start() and _receiver() loop until this is set
+    try:
+        await asyncio.wait_for(live._socket.close(), LIVE_FINISH_TIMEOUT_SEC)
+    except Exception as e:
+        print(f"⚠️  Could not close live transcription socket: {e}")
+
+async def _record_and_stream():
+    """Record one utterance while streaming each frame to a Deepgram live socket.
+
+    The mic opens straight away; frames captured while the socket is still
+    connecting are held back and sent as soon as it is up.
+    """
+    finals = []
+    backlog = []  # frames captured before the socket connected
+    live = None
+    connecting = True
+
+    def on_transcript(msg):
+        if not isinstance(msg, dict) or not msg.get("is_final"):
+            return
+        alts = msg.get("channel", {}).get("alternatives") or [{}]
+        text = (alts[0].get("transcript") or "").strip()
+        if text:
+            finals.append(text)
+
+    def forward(chunk):
+        # Runs on the event loop, so it is ordered with the backlog flush below
+        if live is not None:
+            live.send(chunk)
+        elif connecting:
+            backlog.append(chunk)
+
+    loop = asyncio.get_running_loop()
+    # Frames come from the PortAudio thread; hand them to the socket on this loop
+    recording = loop.run_in_executor(None, record_until_silence,
+                                     lambda chunk: loop.call_soon_threadsafe(forward, chunk))
+    connect = asyncio.ensure_future(dg.transcription.live(DEEPGRAM_LIVE_OPTIONS))
+    await asyncio.wait([recording, connect], return_when=asyncio.FIRST_COMPLETED)
+
+    if not connect.done():
+        # The caller finished before the handshake did (e.g. the SDK is retrying)
+        connect.cancel()
+        await asyncio.wait([connect])  # let the handshake unwind now, not on the next turn
+        print("⚠️  Live transcription not connected yet, using REST")
+        return recording.result(), None
+
+    connecting = False
+    try:
+        live = connect.result()
+        live.register_handler(live.event.TRANSCRIPT_RECEIVED, on_transcript)
+        for chunk in backlog:
+            live.send(chunk)
+    except Exception as e:
+        print(f"⚠️  Live transcription unavailable, using REST: {e}")
+        live = None
+    backlog.clear()
+
+    finished = False
+    try:
+        pcm = await recording
+        if live is None:
+            return pcm, None
+        try:
+            # finish() polls for the socket to close with no limit of its own
+            await asyncio.wait_for(live.finish(), LIVE_FINISH_TIMEOUT_SEC)
+        except asyncio.TimeoutError:
+            print("⚠️  Live transcription timed out, using REST")
+            return pcm, None
+        except Exception as e:
+            print(f"⚠️  Live transcription failed, using REST: {e}")
+            return pcm, None
+        finished = True
+        return pcm, " ".join(finals)
+    finally:
+        if live is not None and not finished:
+            # Stop forwarding frames, then tear the socket down so it is not resumed next turn
+            abandoned, live = live, None
+            await _close_live(abandoned)
+
+def listen_and_transcribe():
+    """Record until silence, transcribing while the caller speaks.
+
+    Returns (pcm, transcript). transcript is None if the live socket could not
+    be used, in which case the caller should fall back to asr_deepgram_pcm16.
+    """
+    try:
+        init_clients()  # Initialize clients if needed
+    except Exception as e:
+        print(f"⚠️  Live transcription unavailable, using REST: {e}")
+        return record_until_silence(), None
+
+    return run_async(_record_and_stream())
+
 # ---------- LLM ----------
 def llm_character_reply(character_name, user_text):
     try:
@@ -423,58 +569,323 @@ def llm_character_reply(character_name, user_text):
         return resp.choices[0].message.content.strip()
     except Exception as e:
         print(f"❌ AI response generation failed: {e}")
-        return "I'm having trouble thinking right now. Could you try again?"
+        return FALLBACK_REPLY
+
+SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+# Until the first piece is out, a long opening sentence is flushed early at a clause break,
+# so speech starts sooner; later sentences are kept whole for natural prosody
+SENTENCE_SOFT_CAP = 40
+CLAUSE_BREAK = re.compile(r"(?<=[,;:])\s+")
+
+def split_soft_cap(text):
+    """Split text at its last clause break; returns (head, rest), head "" if there is none."""
+    breaks = list(CLAUSE_BREAK.finditer(text))
+    if not breaks:
+        return "", text
+    return text[:breaks[-1].start()], text[breaks[-1].end():]
+
+def llm_character_reply_sentences(character_name, user_text):
+    """Stream the reply and yield it one sentence at a time, so TTS can start on the first."""
+    yielded = False
+    try:
+        init_clients()  # Initialize clients if needed
+        system = SYSTEM_PROMPTS[character_name]
+        # The context manager closes the HTTP stream if we are closed early (barge-in)
+        with oai.chat.completions.create(
+            model="gpt-4o-mini",
+            temperature=0.7,
+            messages=[{"role":"system","content":system},
+                      {"role":"user","content":user_text}],
+            stream=True,
+        ) as stream:
+            pending = ""
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                pending += chunk.choices[0].delta.content or ""
+                *sentences, pending = SENTENCE_END.split(pending)
+                if not yielded and not sentences and len(pending) > SENTENCE_SOFT_CAP:
+                    head, pending = split_soft_cap(pending)
+                    sentences.append(head)
+                for sentence in sentences:
+                    if sentence.strip():
+                        yielded = True
+                        yield sentence.strip()
+        if pending.strip():
+            yielded = True
+            yield pending.strip()
+    except Exception as e:
+        print(f"❌ AI response generation failed: {e}")
+        if not yielded:
+            yield FALLBACK_REPLY
+
+def echo_reply(character_name, sentences):
+    """Print each sentence of a streamed reply as it is handed on to TTS."""
+    try:
+        for sentence in sentences:
+            print(f"{character_name.upper()}: {sentence}")
+            yield sentence
+    finally:
+        sentences.close()  # pass cancellation on to the LLM stream
 
 # ---------- TTS with barge-in ----------
-def speak_tts_with_barge_in(voice_id_or_name: str, text: str):
-    """Play TTS with pre-roll; if barge-in enabled, stop as soon as user starts speaking."""
-    global current_playback
+class StreamingPlayback:
+    """Play 16-bit mono PCM chunks through the default output device as they arrive.
+
+    Exposes is_playing()/stop() like simpleaudio's PlayObject so the barge-in
+    monitor can poll and interrupt it while synthesis is still in flight.
+    """
+
+    def __init__(self, chunks, sample_rate, preroll_ms=0):
+        self.chunks = []  # audio received so far (used for echo detection)
+        self._stop = threading.Event()
+        self._done = threading.Event()
+        self._block = 2 * (sample_rate * FRAME_MS // 1000)  # write ~one frame at a time
+        self._thread = threading.Thread(target=self._run, args=(chunks, sample_rate, preroll_ms), daemon=True)
+        self._thread.start()
+
+    def _run(self, chunks, sample_rate, preroll_ms):
+        out = None
+        try:
+            out = sd.RawOutputStream(samplerate=sample_rate, channels=1, dtype='int16')
+            out.start()
+            if preroll_ms > 0:
+                # Short silence so the first phoneme is not cut off
+                out.write(bytes(2 * (sample_rate * preroll_ms // 1000)))
+            pending = b""
+            for chunk in chunks:
+                self.chunks.append(chunk)
+                pending += chunk
+                usable = len(pending) & ~1  # whole int16 samples only
+                for i in range(0, usable, self._block):
+                    if self._stop.is_set():
+                        return
+                    out.write(pending[i:min(i + self._block, usable)])
+                pending = pending[usable:]
+        except Exception as e:
+            print(f"❌ Audio playback failed: {e}")
+        finally:
+            if out is not None:
+                # abort() drops queued audio on barge-in; stop() lets it drain
+                (out.abort if self._stop.is_set() else out.stop)()
+                out.close()
+            self._done.set()
+
+    def is_playing(self):
+        return not self._done.is_set()
+
+    def stop(self):
+        self._stop.set()
+
+    def wait_done(self):
+        self._done.wait()
+
+# Pre-rendered PCM for fixed phrases, keyed by (voice, text); mirrored on disk across runs.
+# In memory it is a small LRU so a long-running kiosk does not accumulate every voice's audio.
+tts_cache = OrderedDict()
+tts_cache_lock = threading.Lock()
+TTS_CACHE_MAX = 32
+TTS_CACHE_DIR = os.getenv("TTS_CACHE_DIR", ".tts_cache")
+# Renders headed for the cache that are in flight, keyed like tts_cache; the Event is set when done
+tts_rendering = {}
+TTS_RENDER_WAIT_SEC = 10
+
+def _tts_cache_path(voice_id_or_name, text):
+    key = hashlib.sha1(f"{voice_id_or_name}|{TTS_OUTPUT_FORMAT}|{text}".encode("utf-8")).hexdigest()
+    return os.path.join(TTS_CACHE_DIR, key + ".pcm")
+
+def get_cached_tts(voice_id_or_name, text):
+    """Return cached PCM for text from memory or disk, or None"""
+    key = (voice_id_or_name, text)
+    with tts_cache_lock:
+        pcm = tts_cache.get(key)
+        if pcm is not None:
+            tts_cache.move_to_end(key)
+            return pcm
+    try:
+        with open(_tts_cache_path(voice_id_or_name, text), "rb") as f:
+            pcm = f.read()
+    except OSError:
+        return None
+    _remember_tts(key, pcm)
+    return pcm
+
+def _remember_tts(key, pcm):
+    with tts_cache_lock:
+        tts_cache[key] = pcm
+        tts_cache.move_to_end(key)
+        while len(tts_cache) > TTS_CACHE_MAX:
+            tts_cache.popitem(last=False)
+
+def claim_tts_render(voice_id_or_name, text):
+    """Claim the cache render of text; returns None if claimed, else the Event of the render in flight"""
+    key = (voice_id_or_name, text)
+    with tts_cache_lock:
+        pending = tts_rendering.get(key)
+        if pending is None:
+            tts_rendering[key] = threading.Event()
+        return pending
+
+def release_tts_render(voice_id_or_name, text):
+    with tts_cache_lock:
+        tts_rendering.pop((voice_id_or_name, text)).set()
 
+def store_cached_tts(voice_id_or_name, text, pcm):
+    """Keep PCM for text in memory and write it to the disk cache"""
+    _remember_tts((voice_id_or_name, text), pcm)
+    try:
+        os.makedirs(TTS_CACHE_DIR, exist_ok=True)
+        # A temp file of our own, so concurrent writers never share one
+        fd, tmp = tempfile.mkstemp(dir=TTS_CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(pcm)
+            os.replace(tmp, _tts_cache_path(voice_id_or_name, text))  # never leave a half-written entry
+        except OSError:
+            os.remove(tmp)
+            raise
+    except OSError as e:
+        print(f"⚠️  Could not write TTS cache: {e}")
+
+def prerender_phrases(voice_id_or_name, texts):
+    """Synthesize fixed phrases into the TTS cache ahead of time (run in a background thread)."""
     try:
         init_clients()  # Initialize clients if needed
-        # Generate audio
-        stream = eleven.text_to_speech.convert(
-            voice_id_or_name,
-            model_id="eleven_multilingual_v2",
-            text=text,
-        )
-        audio_bytes = b"".join(stream)
-        seg = AudioSegment.from_file(BytesIO(audio_bytes), format="mp3")
-        
-        # Store TTS audio for echo detection
-        global current_tts_audio
-        current_tts_audio = seg
     except Exception as e:
-        print(f"❌ Text-to-speech failed: {e}")
+        print(f"⚠️  Could not pre-render phrases: {e}")
         return
+    for text in texts:
+        if get_cached_tts(voice_id_or_name, text) is not None:
+            continue
+        if claim_tts_render(voice_id_or_name, text) is not None:
+            continue  # another thread is already rendering it
+        try:
+            if get_cached_tts(voice_id_or_name, text) is not None:
+                continue  # stored by another render between the check and the claim
+            store_cached_tts(voice_id_or_name, text, b"".join(eleven.text_to_speech.convert(
+                voice_id_or_name,
+                model_id="eleven_multilingual_v2",
+                text=text,
+                output_format=TTS_OUTPUT_FORMAT,
+            )))
+        except Exception as e:
+            print(f"⚠️  Could not pre-render '{text}': {e}")
+        finally:
+            release_tts_render(voice_id_or_name, text)
+
+def prerender_greetings():
+    """Make sure every character's greeting is cached, so pickup plays it immediately."""
+    for persona in CHARACTERS.values():
+        prerender_phrases(persona["voice_pref"], [GREETING_TEMPLATE.format(name=persona["name"])])
 
-    # Prepend a short silence to avoid cutting off first phoneme
-    if TTS_PREROLL_MS > 0:
-        seg = AudioSegment.silent(duration=TTS_PREROLL_MS) + seg
+def tts_chunks(voice_id_or_name, sentences, cache=False, cancel=None):
+    """Synthesize each sentence in turn, yielding PCM chunks as ElevenLabs streams them.
 
-    # Start playback in a background thread
-    def _play(segment: AudioSegment):
-        global current_playback
+    With cache=True, fully synthesized sentences are saved for next time.
+    Once cancel is set, no further sentence is sent to ElevenLabs.
+    """
+    for sentence in sentences:
+        if cancel is not None and cancel.is_set():
+            return
+        cached = get_cached_tts(voice_id_or_name, sentence)
+        store = False
+        if cached is None and cache:
+            pending = claim_tts_render(voice_id_or_name, sentence)
+            if pending is None:
+                # Another render may have stored it between the check and the claim
+                cached = get_cached_tts(voice_id_or_name, sentence)
+                if cached is None:
+                    store = True
+                else:
+                    release_tts_render(voice_id_or_name, sentence)
+            elif pending.wait(TTS_RENDER_WAIT_SEC):
+                # Reuse the pre-render already in flight rather than pay for the phrase twice
+                cached = get_cached_tts(voice_id_or_name, sentence)
+        if cached is not None:
+            yield cached
+            continue
         try:
-            with playback_lock:
-                current_playback = play_buffer(segment.raw_data, segment.channels, segment.sample_width, segment.frame_rate)
+            parts = []
+            for chunk in eleven.text_to_speech.convert(
+                voice_id_or_name,
+                model_id="eleven_multilingual_v2",
+                text=sentence,
+                output_format=TTS_OUTPUT_FORMAT,
+            ):
+                if store:
+                    parts.append(chunk)
+                yield chunk
+                if cancel is not None and cancel.is_set():
+                    return  # drops the ElevenLabs response mid-sentence
+            if store:
+                store_cached_tts(voice_id_or_name, sentence, b"".join(parts))
         except Exception as e:
-            print(f"❌ Audio playback failed: {e}")
-            with playback_lock:
-                current_playback = None
-    
-    t = threading.Thread(target=_play, args=(seg,), daemon=True)
-    t.start()
+            print(f"❌ Text-to-speech failed: {e}")
+        finally:
+            if store:
+                release_tts_render(voice_id_or_name, sentence)
+
+def prefetch_tts_chunks(voice_id_or_name, sentences, cancel, cache=False):
+    """Run the LLM/TTS producer on a worker thread so synthesis stays ahead of playback.
+
+    Setting cancel stops the worker and closes the in-flight TTS and LLM streams.
+    """
+    q = queue.Queue()
+    done = object()
+
+    def worker():
+        chunks = tts_chunks(voice_id_or_name, sentences, cache, cancel)
+        try:
+            for chunk in chunks:
+                if cancel.is_set():
+                    break
+                q.put(chunk)
+        finally:
+            chunks.close()  # drops the ElevenLabs response mid-sentence
+            close_sentences = getattr(sentences, "close", None)
+            if close_sentences is not None:
+                close_sentences()  # stops the OpenAI completion stream
+            q.put(done)
+
+    threading.Thread(target=worker, daemon=True).start()
+    while True:
+        chunk = q.get()
+        if chunk is done:
+            return
+        yield chunk
+
+def speak_tts_with_barge_in(voice_id_or_name: str, text, cache=False):
+    """Play TTS with pre-roll; if barge-in enabled, stop as soon as user starts speaking.
+
+    text may be a string or an iterable of sentences (e.g. a streamed LLM reply).
+    Pass cache=True for fixed lines so their audio is reused on later calls.
+    """
+    global current_playback
+
+    try:
+        init_clients()  # Initialize clients if needed
+        # Start synthesis; chunks are played as they stream in
+        cancel = threading.Event()
+        stream = prefetch_tts_chunks(voice_id_or_name, [text] if isinstance(text, str) else text, cancel, cache)
+        # Pull the first chunk here so nothing is opened if synthesis fails
+        first = next(stream, None)
+    except Exception as e:
+        print(f"❌ Text-to-speech failed: {e}")
+        return
+    if first is None:
+        return  # nothing was synthesized (tts_chunks already reported why)
+
+    po = StreamingPlayback(itertools.chain([first], stream), TTS_SAMPLE_RATE, TTS_PREROLL_MS)
+    with playback_lock:
+        current_playback = po
+
+    # Store TTS audio for echo detection
+    global current_tts_audio
+    current_tts_audio = po.chunks
 
     if not ENABLE_BARGEIN:
-        t.join()
         # Wait for playback to finish
-        while True:
-            with playback_lock:
-                po = current_playback
-            if po is None or not po.is_playing():
-                break
-            time.sleep(0.05)
+        po.wait_done()
         return
 
     # Wait for initial TTS playback to avoid echo detection
@@ -485,18 +896,17 @@ def speak_tts_with_barge_in(voice_id_or_name: str, text: str):
     q = queue.Queue()
     
     # Audio buffer to capture speech that triggers barge-in
-    audio_buffer = []
-    buffer_size = int(2.0 * SAMPLE_RATE / (SAMPLE_RATE * FRAME_MS / 1000))  # 2 seconds of audio
+    audio_buffer = deque(maxlen=2000 // FRAME_MS)  # 2 seconds of audio; oldest frames fall off in O(1)
 
     def mic_cb(indata, frames, time_info, status):
         # Push raw 16-bit bytes
         q.put(bytes(indata))
 
     debounce = 0
-    start_time = time.time()
+    bargein_armed_at = time.monotonic() + 3.0  # Disable barge-in for first 3 seconds
     try:
         with sd.RawInputStream(samplerate=SAMPLE_RATE,
-                               blocksize=int(SAMPLE_RATE * FRAME_MS / 1000),
+                               blocksize=FRAME_SAMPLES,
                                channels=CHANNELS, dtype='int16', callback=mic_cb):
             while True:
                 # Check if playback already ended
@@ -512,16 +922,13 @@ def speak_tts_with_barge_in(voice_id_or_name: str, text: str):
 
                 # Add chunk to audio buffer (maintain rolling 2-second buffer)
                 audio_buffer.append(chunk)
-                if len(audio_buffer) > buffer_size:
-                    audio_buffer.pop(0)
 
                 # Only enable barge-in after a delay to avoid echo from TTS startup
-                elapsed = time.time() - start_time
-                if elapsed < 3.0:  # Disable barge-in for first 3 seconds
+                if time.monotonic() < bargein_armed_at:
                     continue
 
                 # More stringent barge-in detection: require VAD, volume, and not echo
-                if (len(chunk) == int(SAMPLE_RATE * FRAME_MS / 1000) * 2 and 
+                if (len(chunk) == FRAME_BYTES and 
                     vad.is_speech(chunk, SAMPLE_RATE) and 
                     is_loud_enough_for_bargein(chunk) and
                     not is_likely_echo(chunk)):
@@ -533,6 +940,8 @@ def speak_tts_with_barge_in(voice_id_or_name: str, text: str):
                         global bargein_audio_buffer
                         bargein_audio_buffer = b"".join(audio_buffer)
                         
+                        # Stop generating the rest of the reply nobody will hear
+                        cancel.set()
                         with playback_lock:
                             if current_playback and current_playback.is_playing():
                                 current_playback.stop()
@@ -543,8 +952,6 @@ def speak_tts_with_barge_in(voice_id_or_name: str, text: str):
     except Exception as e:
         print(f"❌ Barge-in monitoring failed: {e}")
 
-    # Ensure playback thread exits
-    t.join(timeout=0.1)
 
 # ---------- UI ----------
 def pick_character():
@@ -558,6 +965,10 @@ def pick_character():
 
 def main_loop(text_mode=False):
     print("\nTime Travel Hotline (PC Prototype)")
+
+    if not text_mode:
+        # Fill the greeting cache while we wait for someone to pick up
+        threading.Thread(target=prerender_greetings, daemon=True).start()
     
     if IS_RASPBERRY_PI:
         print("🍓 Running on Raspberry Pi with hardware integration")
@@ -591,6 +1002,9 @@ def main_loop(text_mode=False):
     else:
         input("Press Enter to start a session; Ctrl+C to quit...")
 
+    # Connect while the caller is still choosing a character
+    threading.Thread(target=warm_clients, daemon=True).start()
+
     try:
         if IS_RASPBERRY_PI and not text_mode:
             # Always use software character selection for now
@@ -606,7 +1020,10 @@ def main_loop(text_mode=False):
         if text_mode:
             print(f"Hello. You are speaking with {name}. Type your questions below.")
         else:
-            speak_tts_with_barge_in(voice_pref, f"Hello. You are speaking with {name}. Ask your question.")
+            # Render the closing lines while the greeting plays
+            threading.Thread(target=prerender_phrases, args=(voice_pref, [FAREWELL_TEXT, FALLBACK_REPLY]),
+                             daemon=True).start()
+            speak_tts_with_barge_in(voice_pref, GREETING_TEMPLATE.format(name=name), cache=True)
 
         while True:
             try:
@@ -628,7 +1045,7 @@ def main_loop(text_mode=False):
                     if not user_text:
                         continue
                     
-                    if user_text.lower() in {"goodbye","hang up","bye","end call","quit","exit"}:
+                    if TEXT_GOODBYE_RE.fullmatch(user_text):
                         print(f"{name}: Goodbye.")
                         print("Call ended.")
                         break
@@ -650,24 +1067,24 @@ def main_loop(text_mode=False):
                             continue
                     else:
                         print("🎤 Listening...")
-                        pcm = record_until_silence()
+                        pcm, user_text = listen_and_transcribe()
                         if len(pcm) < 16000:
                             continue
 
-                        print("📝 Transcribing...")
-                        user_text = asr_deepgram_pcm16(pcm)
+                        if user_text is None:
+                            print("📝 Transcribing...")
+                            user_text = asr_deepgram_pcm16(pcm)
                         print(f"YOU: {user_text}")
                         if not user_text:
                             continue
 
-                    if user_text.lower() in {"goodbye","hang up","bye","end call"}:
-                        speak_tts_with_barge_in(voice_pref, "Goodbye.")
+                    if GOODBYE_RE.fullmatch(user_text):
+                        speak_tts_with_barge_in(voice_pref, FAREWELL_TEXT, cache=True)
                         print("Call ended.")
                         break
 
                     print("🤖 Thinking...")
-                    reply = llm_character_reply(name, user_text)
-                    print(f"{name.upper()}: {reply}")
+                    reply = echo_reply(name, llm_character_reply_sentences(name, user_text))
 
                     print("🔊 Speaking...")
                     speak_tts_with_barge_in(voice_pref, reply)